@@ -0,0 +1,47 @@
+import sys
+import os
+import json
+import argparse
+
+#making benchmark module available
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_root)  # Add project root to sys.path
+
+# importing ingest framework and benchmark.
+from ingestion.schema_utils.create_schema import load_db_config
+from transformations.benchmark.benchmark_models import (
+    TransformationBenchmark, SCALES, REGRESSION_THRESHOLD, save_results, find_failures, find_regressions
+)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the dbt models over synthetic raw data. Truncates the raw tables.")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="Number of orders to generate per run.")
+    parser.add_argument("--baseline", help="Previous results JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Relative slowdown flagged as a regression.")
+    args = parser.parse_args()
+
+    db_config = load_db_config('../docker/servers_local.json')
+    benchmark = TransformationBenchmark(db_config)
+    try:
+        results = benchmark.run(args.scales)
+    finally:
+        benchmark.close()
+    save_results(results)
+
+    failures = find_failures(results)
+    for failure in failures:
+        print(f"FAILED {failure}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+    if failures or regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -61,9 +61,11 @@ class FileLoader:
         logging.info(f"Found {len(files)} files in {self.directory}")
         return files
 
-    def stream_file(self, file_path: str) -> Generator[List[str], None, None]:
+    def stream_file(self, file_path: str, raise_errors: bool = False) -> Generator[List[str], None, None]:
         """
         Streams a file line by line, yielding each row as a list.
+        Read errors are logged and end the stream, or are re-raised with raise_errors
+        so callers can tell a partially read file from a complete one.
         """
         try:
             with open(file_path, mode="r", encoding="utf-8") as file:
@@ -72,6 +74,8 @@ class FileLoader:
                     yield row
         except Exception as e:
             logging.error(f"Error loading {file_path}: {e}", exc_info=True)
+            if raise_errors:
+                raise
 
 class DataValidator:
     """
@@ -80,13 +84,21 @@ class DataValidator:
     """
     def __init__(self, schema_loader: SchemaLoader):
         self.schema_loader = schema_loader
+        self._tables: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def tables(self) -> List[Dict[str, Any]]:
+        """Lazy load of the YAML schemas, parsed once and reused for every file validated."""
+        if self._tables is None:
+            self._tables = self.schema_loader.load_tables()
+        return self._tables
 
     def validate_structure(self, file_name: str, header: List[str]) -> Optional[Dict[str, Any]]:
         """
         Checks if file columns match the expected YAML schema.
         Excludes 'source_name' and 'insert_date' from the expected columns.
         """
-        yaml_tables = self.schema_loader.load_tables()
+        yaml_tables = self.tables
         table_name = f'{os.path.splitext(os.path.basename(file_name))[0]}_raw'
         for table in yaml_tables:
             if table["table"] == table_name:
@@ -126,49 +138,70 @@ class DataIngestor:
         self.db = DatabaseConnection(**db_config)
         self.validator = DataValidator(schema_loader)
 
-    def ingest_file(self, file_path: str) -> None:
+    def ingest_file(self, file_path: str, single_transaction: bool = False) -> bool:
         """
         Reads, validates, and inserts data from a file into the database.
         Adds source_name (filename) and insert_date (current UTC timestamp) to each row.
         Writes an error file only if any row fails date conversion.
+        With single_transaction the whole file is committed once at the end and rolled back on any error,
+        otherwise each batch is committed on its own.
+        Returns False if the file was empty, did not match its schema or a batch failed to insert.
         """
         logging.info(f"Starting ingestion for {file_path}")
 
         loader = FileLoader(os.path.dirname(file_path))
-        stream = loader.stream_file(file_path)
+        # In single transaction mode a read error must roll the file back instead of committing a partial load
+        stream = loader.stream_file(file_path, raise_errors=single_transaction)
 
         try:
             header = next(stream)
             logging.debug(f"File {file_path} header: {header}")
         except StopIteration:
             logging.error(f"Empty file: {file_path}")
-            return
+            return False
 
         table_name = f'{os.path.splitext(os.path.basename(file_path))[0]}_raw'
         expected_columns = self.validator.validate_structure(file_path, header)
 
         if not expected_columns:
             logging.error(f"Skipping file {file_path} due to schema mismatch.")
-            return
+            return False
 
         # Extend header with additional columns; these are not in the original file.
         header.extend(["source_name", "insert_date"])
 
+        commit = not single_transaction
+        inserted = True
         valid_batch = []
         error_rows = []  # Collect error rows in memory
-        for row in stream:
-            # Create a copy of the row to avoid modifying the original row in multiple iterations
-            current_row = row.copy()
-            if self.validator.validate_data(current_row, expected_columns, file_path):
-                valid_batch.append(current_row)
-            else:
-                error_rows.append(row)
-            if len(valid_batch) >= BATCH_SIZE:
-                self.insert_data(table_name, header, valid_batch, file_path)
-                valid_batch.clear()
-
-        if valid_batch:
-            self.insert_data(table_name, header, valid_batch, file_path)
+        try:
+            for row in stream:
+                # Create a copy of the row to avoid modifying the original row in multiple iterations
+                current_row = row.copy()
+                if self.validator.validate_data(current_row, expected_columns, file_path):
+                    valid_batch.append(current_row)
+                else:
+                    error_rows.append(row)
+                if len(valid_batch) >= BATCH_SIZE:
+                    inserted &= self.insert_data(table_name, header, valid_batch, file_path, commit)
+                    valid_batch.clear()
+                    if single_transaction and not inserted:
+                        break
+
+            if valid_batch and (inserted or not single_transaction):
+                inserted &= self.insert_data(table_name, header, valid_batch, file_path, commit)
+        except Exception:
+            if single_transaction:
+                self.db.connection.rollback()
+            raise
+
+        if single_transaction:
+            if not inserted:
+                # insert_data already rolled back the whole file
+                logging.error(f"Rolled back all rows of {file_path} due to a failed batch.")
+                return False
+            self.db.connection.commit()
+            logging.info(f"Committed {file_path} into {table_name}")
 
         # Only write error file if there are errors
         if error_rows:
@@ -179,10 +212,15 @@ class DataIngestor:
                 error_writer.writerows(error_rows)
             logging.warning(f"Saved {len(error_rows)} invalid rows to {invalid_file}")
 
-    def insert_data(self, table_name: str, columns: List[str], rows: List[List[str]], file_path: str) -> None:
+        return inserted
+
+    def insert_data(self, table_name: str, columns: List[str], rows: List[List[str]], file_path: str,
+                    commit: bool = True) -> bool:
         """
         Inserts processed data into the database in batches.
         Ensures all values are converted to strings, and appends source_name and insert_date.
+        Commits the batch unless commit is False, in which case the caller owns the transaction.
+        Rolls back on failure so the connection stays usable, discarding any uncommitted batch.
         """
         source_name = os.path.basename(file_path)
         current_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
@@ -196,10 +234,18 @@ class DataIngestor:
         try:
             with self.db.connection.cursor() as cursor:
                 cursor.executemany(query, processed_rows)
+            if commit:
                 self.db.connection.commit()
             logging.info(f"Inserted {len(rows)} rows into {table_name} (Source: {source_name})")
+            return True
         except psycopg2.Error as e:
             logging.error(f"Database insert error in table {table_name}: {e}", exc_info=True)
+            self.db.connection.rollback()
+            return False
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.db.close()
 
 if __name__ == "__main__":
     db_config = load_db_config("../docker/servers_local.json")
@@ -0,0 +1,148 @@
+import os
+import sys
+import signal
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.append(project_root)
+
+from ingestion.schema_utils.load_schema import SchemaLoader
+from ingestion.schema_utils.create_schema import load_db_config
+from ingestion.ingest.load_data import DataIngestor, SUPPORTED_FILE_TYPES
+
+# INFO instead of the DEBUG set by load_data, per row/header debug logs would flood a long running daemon
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(filename)s - %(funcName)s - %(message)s",
+    force=True
+)
+
+POLL_INTERVAL = 5.0
+
+ERROR_FILE_SUFFIX = "_errors.csv"
+
+class DirectoryWatcher:
+    """
+    Long running daemon that ingests files as they land in a directory.
+    Keeps a single DataIngestor alive, so the YAML schemas and the database connection are reused across files.
+    """
+    def __init__(self, ingestor: DataIngestor, directory: str, processed_dir: str, failed_dir: str,
+                 poll_interval: float = POLL_INTERVAL):
+        self.ingestor = ingestor
+        self.directory = directory
+        self.processed_dir = processed_dir
+        self.failed_dir = failed_dir
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._pending: Dict[str, Tuple[int, float]] = {}
+        # Files already ingested that could not be moved out of the directory, never ingested again
+        self._unmovable: Set[str] = set()
+
+    def poll(self) -> List[str]:
+        """
+        Lists the directory and returns the files whose size and modification time
+        did not change since the previous poll, so files still being written are not picked up.
+        """
+        ready = []
+        current = {}
+        # Listed here instead of FileLoader.get_files() to avoid logging on every poll
+        try:
+            file_names = os.listdir(self.directory)
+        except OSError as e:
+            logging.error(f"Error listing {self.directory}, retrying on next poll: {e}")
+            return []
+        for file_name in file_names:
+            file_path = os.path.join(self.directory, file_name)
+            if (file_name.split('.')[-1] not in SUPPORTED_FILE_TYPES
+                    or file_name.endswith(ERROR_FILE_SUFFIX)
+                    or file_path in self._unmovable):
+                continue
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            current[file_path] = (stat.st_size, stat.st_mtime)
+            if self._pending.get(file_path) == current[file_path]:
+                ready.append(file_path)
+        self._pending = {path: sig for path, sig in current.items() if path not in ready}
+        if ready:
+            logging.info(f"{len(ready)} files ready in {self.directory}")
+        return sorted(ready)
+
+    def move_file(self, file_path: str, target_dir: str) -> Optional[str]:
+        """
+        Moves a file into target_dir prefixed with the current UTC timestamp.
+        os.replace is atomic as long as both directories live on the same filesystem.
+        """
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        target = os.path.join(target_dir, f"{timestamp}_{os.path.basename(file_path)}")
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            os.replace(file_path, target)
+            logging.info(f"Moved {file_path} to {target}")
+            return target
+        except OSError as e:
+            logging.error(f"Error moving {file_path} to {target_dir}: {e}", exc_info=True)
+            return None
+
+    def process_file(self, file_path: str) -> bool:
+        """
+        Ingests a single file in one transaction and moves it to the processed or failed directory.
+        Any error file written during ingestion is moved to the failed directory.
+        If the file can't be moved it is remembered and skipped by later polls, so it isn't ingested twice.
+        """
+        try:
+            succeeded = self.ingestor.ingest_file(file_path, single_transaction=True)
+        except Exception as e:
+            logging.error(f"Unexpected error ingesting {file_path}: {e}", exc_info=True)
+            succeeded = False
+
+        if self.move_file(file_path, self.processed_dir if succeeded else self.failed_dir) is None:
+            self._unmovable.add(file_path)
+            logging.error(f"{file_path} stays in {self.directory} and will not be ingested again until the daemon restarts.")
+
+        error_file = f"{file_path}{ERROR_FILE_SUFFIX}"
+        if os.path.exists(error_file):
+            self.move_file(error_file, self.failed_dir)
+        return succeeded
+
+    def stop(self, signum: Optional[int] = None, frame=None) -> None:
+        """
+        Requests a graceful shutdown, the file being ingested finishes all of its batches before the daemon exits.
+        Used as the SIGINT/SIGTERM handler.
+        """
+        if signum is not None:
+            logging.info(f"Received signal {signum}, shutting down after in-flight file.")
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """
+        Polls the directory until stop() is called, ingesting every file that is ready.
+        Closes the database connection on exit.
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        logging.info(f"Watching {self.directory} every {self.poll_interval}s")
+        try:
+            while not self._stop_event.is_set():
+                for file_path in self.poll():
+                    if self._stop_event.is_set():
+                        break
+                    self.process_file(file_path)
+                self._stop_event.wait(self.poll_interval)
+        finally:
+            self.ingestor.close()
+            logging.info("Directory watcher stopped.")
+
+if __name__ == "__main__":
+    db_config = load_db_config("../docker/servers_local.json")
+    schema_loader = SchemaLoader("schemas/definitions/sinch_db/")
+    ingestor = DataIngestor(db_config, schema_loader)
+
+    watcher = DirectoryWatcher(ingestor, "../data/to_process/", "../data/processed/", "../data/failed/")
+    watcher.run()
@@ -0,0 +1,264 @@
+import os
+import sys
+import json
+import logging
+import subprocess
+import psycopg2
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.append(project_root)
+
+from ingestion.utils.db_connection import DatabaseConnection
+from ingestion.schema_utils.create_schema import load_db_config
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(filename)s - %(funcName)s - %(message)s"
+)
+
+DBT_PROJECT_DIR = os.path.join(project_root, "transformations/dbt/sinch")
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Number of orders generated per scale, the other raw tables are sized relative to it.
+SCALES = [10000, 100000, 1000000]
+
+# A model is flagged as a regression when it is this much slower than the baseline...
+REGRESSION_THRESHOLD = 0.2
+# ...and at least this many seconds slower, so sub-second noise on small models is ignored.
+REGRESSION_MIN_SECONDS = 0.5
+
+RAW_TABLES = ["members_raw", "marketing_raw", "orders_raw", "orders_items_raw", "order_status_raw", "preferences_raw"]
+
+# Synthetic raw data generated server side with generate_series, values follow the formats of the files in data/to_process.
+# About 5% of members and campaigns are duplicated so the ROW_NUMBER() dedupe in silver has work to do.
+SEED_QUERIES = {
+    "members_raw": """
+        INSERT INTO members_raw (id, name, membershiptype, joindate, expirationdate, source_name, insert_date)
+        SELECT
+            'M' || LPAD((i %% %(members)s + 1)::TEXT, 8, '0'),
+            'Member ' || i,
+            (ARRAY['Bronze', 'Silver', 'Gold', 'Platinum'])[1 + i %% 4],
+            TO_CHAR(DATE '2023-01-01' + (i %% 365), 'DD/MM/YYYY'),
+            TO_CHAR(DATE '2024-01-01' + (i %% 365), 'DD/MM/YYYY'),
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(members)s + %(members)s / 20) AS i
+    """,
+    "marketing_raw": """
+        INSERT INTO marketing_raw (campaignid, targetaudience, storeid, campaignstartdate, campaignenddate, source_name, insert_date)
+        SELECT
+            'C' || LPAD((i %% %(campaigns)s + 1)::TEXT, 8, '0'),
+            (ARRAY['Bronze', 'Silver', 'Gold', 'Silver,Gold'])[1 + i %% 4],
+            'S' || LPAD((i %% 50 + 1)::TEXT, 5, '0'),
+            TO_CHAR(DATE '2023-01-01' + (i %% 365), 'DD/MM/YYYY'),
+            TO_CHAR(DATE '2023-06-01' + (i %% 365), 'DD/MM/YYYY'),
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(campaigns)s + %(campaigns)s / 20) AS i
+    """,
+    "orders_raw": """
+        INSERT INTO orders_raw (orderid, memberid, storeid, campaignid, orderdate, subtotal, total, source_name, insert_date)
+        SELECT
+            'R' || LPAD(i::TEXT, 10, '0'),
+            'M' || LPAD((i %% %(members)s + 1)::TEXT, 8, '0'),
+            'S' || LPAD((i %% 50 + 1)::TEXT, 5, '0'),
+            CASE WHEN i %% 3 = 0 THEN 'C' || LPAD((i %% %(campaigns)s + 1)::TEXT, 8, '0') END,
+            -- orders_raw only has the [2023-01-01, 2023-12-31) and [2024-01-01, 2024-12-31) partitions, 2023-12-31 is skipped
+            DATE '2023-01-01' + (i %% 729) + CASE WHEN i %% 729 >= 364 THEN 1 ELSE 0 END,
+            (i %% 200 + 5)::TEXT,
+            ROUND((i %% 200 + 5) * 1.015, 2)::TEXT,
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(orders)s) AS i
+    """,
+    "orders_items_raw": """
+        INSERT INTO orders_items_raw (orderid, itemname, price, source_name, insert_date)
+        SELECT
+            'R' || LPAD(((i - 1) / 3 + 1)::TEXT, 10, '0'),
+            (ARRAY['Burger', 'Fries', 'Shake', 'Salad', 'Wrap', 'Soda'])[1 + i %% 6],
+            (i %% 60 + 5)::TEXT,
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(orders)s * 3) AS i
+    """,
+    "order_status_raw": """
+        INSERT INTO order_status_raw (orderid, status, statustimestamp, source_name, insert_date)
+        SELECT
+            'R' || LPAD(((i - 1) / 3 + 1)::TEXT, 10, '0'),
+            (ARRAY['Submitted', 'In Progress', 'Delivered'])[1 + (i - 1) %% 3],
+            TO_CHAR(TIMESTAMP '2023-01-01 08:00:00' + ((i - 1) / 3 %% 730) * INTERVAL '1 day'
+                    + ((i - 1) %% 3) * INTERVAL '15 minutes', 'DD/MM/YYYY HH24:MI:SS'),
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(orders)s * 3) AS i
+    """,
+    "preferences_raw": """
+        INSERT INTO preferences_raw (memberid, preference, source_name, insert_date)
+        SELECT
+            'M' || LPAD((i %% %(members)s + 1)::TEXT, 8, '0'),
+            (ARRAY['Extra Onions', 'No Salt', 'Extra Cheese', 'No Ice'])[1 + i %% 4],
+            'benchmark', CURRENT_TIMESTAMP
+        FROM generate_series(1, %(members)s) AS i
+    """,
+}
+
+class TransformationBenchmark:
+    """
+    Seeds the raw tables with synthetic data, runs the dbt models and captures timings and query plans per model.
+    The raw tables are truncated before seeding, only run it against a local/benchmark database.
+    """
+    def __init__(self, db_config: Dict[str, str], dbt_project_dir: str = DBT_PROJECT_DIR, profiles_dir: str = "profiles"):
+        self.db = DatabaseConnection(**db_config)
+        self.dbt_project_dir = dbt_project_dir
+        self.profiles_dir = profiles_dir
+
+    def seed_raw_data(self, scale: int) -> None:
+        """
+        Truncates the raw tables and fills them with synthetic data for the given number of orders.
+        Members are a tenth of the orders and campaigns a hundredth.
+        """
+        params = {"orders": scale, "members": max(scale // 10, 1), "campaigns": max(scale // 100, 1)}
+        try:
+            with self.db.connection.cursor() as cursor:
+                cursor.execute(f"TRUNCATE TABLE {', '.join(RAW_TABLES)}")
+                for table_name in RAW_TABLES:
+                    cursor.execute(SEED_QUERIES[table_name], params)
+                    logging.info(f"Seeded {cursor.rowcount} rows into {table_name}")
+                    # Refresh planner statistics so the plans captured reflect the new volumes
+                    cursor.execute(f"ANALYZE {table_name}")
+            self.db.connection.commit()
+        except psycopg2.Error as e:
+            logging.error(f"Error seeding raw data for scale {scale}: {e}", exc_info=True)
+            self.db.connection.rollback()
+            raise
+
+    def run_models(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Runs all dbt models with a full refresh and returns the dbt exit code and the results dbt writes to target/run_results.json.
+        The previous run_results.json is deleted first, so a dbt failure before writing it returns no results instead of stale ones.
+        """
+        run_results_path = os.path.join(self.dbt_project_dir, "target", "run_results.json")
+        if os.path.exists(run_results_path):
+            os.remove(run_results_path)
+
+        command = ["dbt", "run", "--full-refresh", "--profiles-dir", self.profiles_dir]
+        logging.info(f"Running {' '.join(command)} in {self.dbt_project_dir}")
+        completed = subprocess.run(command, cwd=self.dbt_project_dir)
+        if completed.returncode != 0:
+            logging.error(f"dbt run exited with code {completed.returncode}, failed models are reported with their status.")
+
+        if not os.path.exists(run_results_path):
+            logging.error(f"dbt did not write {run_results_path}, no model results for this run.")
+            return completed.returncode, []
+        with open(run_results_path, "r") as file:
+            return completed.returncode, json.load(file)["results"]
+
+    def explain_model(self, compiled_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Runs EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) over the compiled select of a model.
+        The query is executed for real, so it's rolled back afterwards.
+        """
+        try:
+            with self.db.connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled_code}")
+                return cursor.fetchone()[0][0]
+        except psycopg2.Error as e:
+            logging.error(f"Error explaining query: {e}", exc_info=True)
+            return None
+        finally:
+            self.db.connection.rollback()
+
+    def benchmark_scale(self, scale: int) -> Dict[str, Any]:
+        """
+        Seeds the given scale, runs the models and returns the timing and query plan of each of them.
+        """
+        self.seed_raw_data(scale)
+        dbt_exit_code, run_results = self.run_models()
+        models = {}
+        for result in run_results:
+            name = result["unique_id"].split(".")[-1]
+            model = {
+                "status": result["status"],
+                "execution_time": result["execution_time"],
+            }
+            if result["status"] == "success" and result.get("compiled_code"):
+                plan = self.explain_model(result["compiled_code"])
+                if plan:
+                    model.update({
+                        "planning_time_ms": plan["Planning Time"],
+                        "plan_execution_time_ms": plan["Execution Time"],
+                        "shared_hit_blocks": plan["Plan"].get("Shared Hit Blocks"),
+                        "shared_read_blocks": plan["Plan"].get("Shared Read Blocks"),
+                        "temp_written_blocks": plan["Plan"].get("Temp Written Blocks"),
+                        "plan": plan,
+                    })
+            models[name] = model
+            logging.info(f"Scale {scale}: {name} took {result['execution_time']:.2f}s ({result['status']})")
+        return {"dbt_exit_code": dbt_exit_code, "models": models}
+
+    def run(self, scales: List[int] = SCALES) -> Dict[str, Any]:
+        """
+        Benchmarks every scale and returns the results ready to be stored as JSON.
+        """
+        results = {"run_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"), "scales": {}}
+        for scale in scales:
+            logging.info(f"Benchmarking scale {scale}")
+            results["scales"][str(scale)] = self.benchmark_scale(scale)
+        return results
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.db.close()
+
+def save_results(results: Dict[str, Any], output_dir: str = RESULTS_DIR) -> str:
+    """
+    Writes benchmark results to a timestamped JSON file and returns its path.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    output_path = os.path.join(output_dir, f"benchmark_{timestamp}.json")
+    with open(output_path, "w") as file:
+        json.dump(results, file, indent=2)
+    logging.info(f"Saved benchmark results to {output_path}")
+    return output_path
+
+def find_failures(results: Dict[str, Any]) -> List[str]:
+    """
+    Returns a message for every scale where dbt exited with a non-zero code.
+    """
+    return [f"Scale {scale}: dbt run exited with code {scale_results['dbt_exit_code']}"
+            for scale, scale_results in results["scales"].items()
+            if scale_results.get("dbt_exit_code")]
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any],
+                     threshold: float = REGRESSION_THRESHOLD,
+                     min_seconds: float = REGRESSION_MIN_SECONDS) -> List[str]:
+    """
+    Compares each model against a baseline run, for the scales present in both.
+    Returns a message for every model that succeeded in the baseline but is now missing or didn't succeed,
+    and for every model slower than the baseline by more than threshold and min_seconds.
+    """
+    regressions = []
+    for scale, scale_results in results["scales"].items():
+        baseline_models = baseline["scales"].get(scale, {}).get("models", {})
+        for name, previous in baseline_models.items():
+            model = scale_results["models"].get(name)
+            if previous["status"] != "success":
+                continue
+            if not model or model["status"] != "success":
+                status = model["status"] if model else "missing"
+                regressions.append(f"Scale {scale}: {name} finished with status {status}, baseline success")
+                continue
+            current_time = model["execution_time"]
+            previous_time = previous["execution_time"]
+            if previous_time and current_time > previous_time * (1 + threshold) and current_time - previous_time > min_seconds:
+                regressions.append(
+                    f"Scale {scale}: {name} took {current_time:.2f}s, baseline {previous_time:.2f}s "
+                    f"(+{(current_time / previous_time - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+#this is for testing this standalone script assuming is run in the transformations/benchmark folder
+if __name__ == "__main__":
+    db_config = load_db_config("../../docker/servers_local.json")
+    benchmark = TransformationBenchmark(db_config)
+    save_results(benchmark.run([10000]))
+    benchmark.close()
@@ -2,20 +2,94 @@
     config(
         materialized='incremental',
         incremental_strategy='merge',
-        unique_key='orderid'
+        unique_key='orderid',
+        indexes=[
+            {'columns': ['orderid'], 'unique': True},
+            {'columns': ['orderdate']},
+            {'columns': ['insert_date']}
+        ]
     ) 
 }}
 
-WITH  base_filtered as (
+-- snapshots are only referenced in incremental runs, declaring them here so dbt always builds them first
+-- depends_on: {{ ref('snap_members') }}
+-- depends_on: {{ ref('snap_marketing') }}
+
+{% if is_incremental() and execute %}
+    -- Last run of this model, looked up once through the insert_date/orderdate indexes and inlined as literals,
+    -- so the planner estimates the change sets from statistics instead of a generic guess for an unknown value.
+    -- insert_date is cast to TIMESTAMP to compare it with the snapshot dbt_valid_from/dbt_valid_to columns as they are.
+    {% set last_run_query %}
+        SELECT 
+            MAX(insert_date)::TIMESTAMP::TEXT AS last_insert_date,
+            MAX(orderdate)::TEXT AS last_orderdate
+        FROM 
+            {{ this }}
+    {% endset %}
+    {% set last_run = run_query(last_run_query).rows[0] %}
+    {% set last_insert_date = "'" ~ last_run[0] ~ "'::TIMESTAMP" if last_run[0] else "NULL" %}
+    {% set last_orderdate = "'" ~ last_run[1] ~ "'::DATE" if last_run[1] else "NULL" %}
+{% endif %}
+
+WITH
+{% if is_incremental() %}
+-- Members and campaigns that were inserted, updated or deleted since the last run of this model
+changed_members AS (
+    SELECT DISTINCT
+        memberid
+    FROM 
+        {{ ref('snap_members') }}
+    WHERE 
+        dbt_valid_from > {{ last_insert_date }}
+        OR dbt_valid_to > {{ last_insert_date }}
+)
+, changed_campaigns AS (
+    SELECT DISTINCT
+        campaignid
+    FROM 
+        {{ ref('snap_marketing') }}
+    WHERE 
+        dbt_valid_from > {{ last_insert_date }}
+        OR dbt_valid_to > {{ last_insert_date }}
+)
+-- One select per condition so each one can use its own stg_orders index, instead of a single OR'ed seq scan
+, base_filtered as (
+    -- Process only new or updated records from the last orderdate, including the last order date records
+    SELECT
+        o.*
+    FROM 
+        {{ ref('stg_orders') }} o
+    WHERE 
+        o.orderdate >= {{ last_orderdate }}
+
+    UNION
+
+    -- Re-merge historical orders whose member changed, the rest of the history is left untouched
+    SELECT
+        o.*
+    FROM 
+        {{ ref('stg_orders') }} o
+    JOIN 
+        changed_members cm ON o.memberid = cm.memberid
+
+    UNION
+
+    -- Re-merge historical orders whose campaign changed
+    SELECT
+        o.*
+    FROM 
+        {{ ref('stg_orders') }} o
+    JOIN 
+        changed_campaigns cc ON o.campaignid = cc.campaignid
+)
+{% else %}
+base_filtered as (
     SELECT
         *
     FROM 
         {{ ref('stg_orders') }}
-    {% if is_incremental() %}
-    -- Process only new or updated records from the last orderdate, including the last order date records
-    WHERE orderdate >= (SELECT MAX(orderdate) FROM {{ this }})
-    {% endif %}
 )
+{% endif %}
 , enriched_orders AS (
     -- This select using 2 components
         -- get_filtered_columns_in_relation: this is to dinamically create a list of columns for the select while excluding some
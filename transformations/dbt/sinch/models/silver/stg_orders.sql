@@ -2,10 +2,19 @@
     config(
         materialized='incremental',
         incremental_strategy='merge',
-        unique_key='orderid'
+        unique_key='orderid',
+        indexes=[
+            {'columns': ['orderid'], 'unique': True},
+            {'columns': ['orderdate']},
+            {'columns': ['memberid']},
+            {'columns': ['campaignid']}
+        ],
+        post_hook='ANALYZE {{ this }}'
     ) 
 }}
 
+-- post_hook refreshes statistics so build_orders picks the memberid/campaignid indexes when re-merging changed dimensions
+
 WITH deduplicated_orders AS (
     SELECT 
         *,
@@ -0,0 +1,21 @@
+{% snapshot snap_marketing %}
+
+{{ 
+    config(
+        unique_key='campaignid',
+        strategy='check',
+        check_cols=['targetaudience', 'campaignstartdate', 'campaignenddate'],
+        hard_deletes='invalidate'
+    ) 
+}}
+
+-- Versions stg_marketing so build_orders can re-merge only the orders of campaigns that changed since its last run
+SELECT 
+    campaignid,
+    targetaudience,
+    campaignstartdate,
+    campaignenddate
+FROM 
+    {{ ref('stg_marketing') }}
+
+{% endsnapshot %}
@@ -0,0 +1,22 @@
+{% snapshot snap_members %}
+
+{{ 
+    config(
+        unique_key='memberid',
+        strategy='check',
+        check_cols=['membername', 'membershiptype', 'joindate', 'expirationdate'],
+        hard_deletes='invalidate'
+    ) 
+}}
+
+-- Versions stg_members so build_orders can re-merge only the orders of members that changed since its last run
+SELECT 
+    memberid,
+    membername,
+    membershiptype,
+    joindate,
+    expirationdate
+FROM 
+    {{ ref('stg_members') }}
+
+{% endsnapshot %}